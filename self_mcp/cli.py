@@ -1,15 +1,11 @@
 #!/usr/bin/env python3
 """CLI entry point for self-mcp"""
 
-import subprocess
-import sys
-from pathlib import Path
+from self_mcp.server import run
 
 
 def main():
-    """Start the Self MCP server"""
-    # Import and run directly to avoid subprocess import issues
-    from self_mcp.server import run
+    """Start the Self MCP server in-process"""
     run()
 
 
@@ -1,12 +1,6 @@
 """Prompt for designing Self verification flows"""
 
-
-async def design_verification_flow(
-    use_case: str,
-    requirements: str
-) -> str:
-    """Help design a custom Self verification flow"""
-    return f"""I'll help you design a Self verification flow for {use_case}.
+DESIGN_FLOW_PROMPT = """I'll help you design a Self verification flow for {use_case}.
 
 Requirements: {requirements}
 
@@ -16,4 +10,12 @@ Let's consider:
 3. How will you prevent sybil attacks?
 4. What's the user journey?
 
-Please provide more details about your specific needs."""
\ No newline at end of file
+Please provide more details about your specific needs."""
+
+
+async def design_verification_flow(
+    use_case: str,
+    requirements: str
+) -> str:
+    """Help design a custom Self verification flow"""
+    return DESIGN_FLOW_PROMPT.format(use_case=use_case, requirements=requirements)
\ No newline at end of file
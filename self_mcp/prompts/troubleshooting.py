@@ -1,16 +1,10 @@
 """Prompt for troubleshooting Self integration issues"""
 
-
-async def troubleshoot_integration(
-    error_description: str,
-    code_snippet: str = ""
-) -> str:
-    """Interactive troubleshooting for Self integration issues"""
-    return f"""I'll help troubleshoot your Self integration issue.
+TROUBLESHOOT_PROMPT = """I'll help troubleshoot your Self integration issue.
 
 Error: {error_description}
 
-{f'Code: {code_snippet}' if code_snippet else ''}
+{code_block}
 
 Let me analyze this step by step:
 1. First, let's verify your configuration
@@ -20,4 +14,13 @@ Let me analyze this step by step:
 Can you also provide:
 - Your frontend scope value
 - Backend scope value  
-- Any console errors?"""
\ No newline at end of file
+- Any console errors?"""
+
+
+async def troubleshoot_integration(
+    error_description: str,
+    code_snippet: str = ""
+) -> str:
+    """Interactive troubleshooting for Self integration issues"""
+    code_block = f"Code: {code_snippet}" if code_snippet else ""
+    return TROUBLESHOOT_PROMPT.format(error_description=error_description, code_block=code_block)
\ No newline at end of file
@@ -3,21 +3,11 @@
 from ..utils.github_client import get_docs_client
 
 
-async def get_best_practices() -> str:
-    """Get Self protocol integration best practices"""
-    client = get_docs_client()
-    
-    # Try to fetch best practices from docs
-    content = await client.fetch_document("best-practices/README.md")
-    if not content:
-        # Try alternative paths
-        content = await client.fetch_document("integration/best-practices.md")
-    
-    if content:
-        return f"# Self Protocol Best Practices\n\n{content}"
-    
-    # Fallback to essential best practices
-    return """# Self Protocol Best Practices
+# Candidate doc paths, in order of preference
+BEST_PRACTICES_PATHS = ("best-practices/README.md", "integration/best-practices.md")
+
+# Served when the best practices doc can't be fetched from GitHub
+BEST_PRACTICES_FALLBACK = """# Self Protocol Best Practices
 
 ## Security
 1. **Never trust client-side verification alone** - Always verify proofs on backend
@@ -47,4 +37,21 @@ async def get_best_practices() -> str:
 1. **Use mock passports** - Set `isMock: true` in development
 2. **Test edge cases** - Invalid proofs, expired proofs, network errors
 3. **Multi-device testing** - Test QR scanning on various devices
-4. **Load testing** - Ensure system handles concurrent verifications"""
\ No newline at end of file
+4. **Load testing** - Ensure system handles concurrent verifications"""
+
+
+async def get_best_practices() -> str:
+    """Get Self protocol integration best practices"""
+    client = get_docs_client()
+    
+    # Try the cached best practices doc first, otherwise probe all paths at once
+    content = client.get_cached(BEST_PRACTICES_PATHS[0])
+    if not content:
+        documents = await client.fetch_documents(BEST_PRACTICES_PATHS)
+        content = next((documents[path] for path in BEST_PRACTICES_PATHS if documents[path]), None)
+    
+    if content:
+        return f"# Self Protocol Best Practices\n\n{content}"
+    
+    # Fallback to essential best practices
+    return BEST_PRACTICES_FALLBACK
\ No newline at end of file
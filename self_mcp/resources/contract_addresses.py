@@ -1,9 +1,7 @@
 """Resource for Self protocol contract addresses"""
 
 
-async def get_contract_addresses() -> str:
-    """Get deployed Self protocol contract addresses"""
-    return """# Self Protocol Contract Addresses (V2)
+CONTRACT_ADDRESSES = """# Self Protocol Contract Addresses (V2)
 
 ## Celo Mainnet (Real Passports)
 - IdentityVerificationHub: 0xe57F4773bd9c9d8b6Cd70431117d353298B9f5BF
@@ -25,4 +23,9 @@ async def get_contract_addresses() -> str:
 - Frontend: @selfxyz/qrcode
 - Backend: @selfxyz/core
 - Contracts: @selfxyz/contracts
-"""
\ No newline at end of file
+"""
+
+
+async def get_contract_addresses() -> str:
+    """Get deployed Self protocol contract addresses"""
+    return CONTRACT_ADDRESSES
\ No newline at end of file
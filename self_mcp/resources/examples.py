@@ -1,22 +1,26 @@
 """Resource for Self protocol example code"""
 
+from types import MappingProxyType
+
 from ..utils.github_client import get_docs_client
 
 
+# Map example types to documentation files
+EXAMPLE_MAP = MappingProxyType({
+    "airdrop": "use-cases/airdrop.md",
+    "age-gate": "use-cases/age-verification.md"
+})
+
+EXAMPLE_NOT_FOUND = "Example not found. Available: " + ", ".join(EXAMPLE_MAP)
+
+
 async def get_example_code(example_type: str) -> str:
     """Get complete example implementations"""
-    client = get_docs_client()
-    
-    # Map example types to documentation files
-    example_map = {
-        "airdrop": "use-cases/airdrop.md",
-        "age-gate": "use-cases/age-verification.md"
-    }
-    
-    doc_path = example_map.get(example_type)
+    doc_path = EXAMPLE_MAP.get(example_type)
     if not doc_path:
-        return "Example not found. Available: airdrop, age-gate"
+        return EXAMPLE_NOT_FOUND
     
+    client = get_docs_client()
     content = await client.fetch_document(doc_path)
     if content:
         return f"# Example: {example_type.replace('-', ' ').title()}\n\n{content}"
@@ -1,5 +1,8 @@
 """Self MCP Server - Clean architecture implementation"""
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
 from fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
@@ -26,6 +29,7 @@ from .tools.contract_interaction import (
     generate_scope_hash,
     generate_config_id,
     read_hub_config,
+    batch_check_configs,
     list_country_codes,
     guide_to_tools,
 )
@@ -42,116 +46,63 @@ from .prompts import (
     troubleshoot_integration,
 )
 
+# Shared HTTP pool, closed on shutdown
+from .utils.github_client import close_http_client
+
+
+# FastMCP enters the lifespan once per client session, not once per process
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared docs HTTP pool when the last session ends"""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_http_client()
+
+
 # Create an MCP server
-mcp = FastMCP("Self-MCP")
-
-# Register tools with annotations for better LLM understanding
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Use this first to understand Self protocol integration",
-        readOnlyHint=True
-    )
-)(explain_self_integration)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Generate ready-to-use code after understanding the integration",
-        readOnlyHint=True
-    )
-)(generate_verification_code)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Debug Self verification errors with solutions",
-        readOnlyHint=True
-    )
-)(debug_verification_error)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Check Self protocol network status and contracts",
-        readOnlyHint=True
-    )
-)(check_self_status)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Generate complete verification configuration",
-        readOnlyHint=True
-    )
-)(generate_verification_config)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Explain Self SDK setup requirements (IConfigStorage, UserIdType, etc.)",
-        readOnlyHint=True
-    )
-)(explain_sdk_setup)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Generate EU ID card verification code (V2 feature)",
-        readOnlyHint=True
-    )
-)(generate_eu_id_verification)
-
-# Register dynamic documentation tools
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Fetch latest Self protocol documentation from GitHub",
-        readOnlyHint=True
-    )
-)(fetch_self_docs)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="List all available documentation topics",
-        readOnlyHint=True
-    )
-)(list_docs_topics)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Search through Self protocol documentation",
-        readOnlyHint=True
-    )
-)(search_docs)
-
-# Register contract interaction tools
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Generate scope hash for Self verification (like tools.self.xyz)",
-        readOnlyHint=True
-    )
-)(generate_scope_hash)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Generate a configuration ID for Self protocol verification",
-        readOnlyHint=True
-    )
-)(generate_config_id)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Read configuration from Self protocol Hub contract",
-        readOnlyHint=True
-    )
-)(read_hub_config)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="Guide users to appropriate tools.self.xyz features",
-        readOnlyHint=True
-    )
-)(guide_to_tools)
-
-mcp.tool(
-    annotations=ToolAnnotations(
-        title="List available country codes for Self protocol exclusions",
-        readOnlyHint=True
-    )
-)(list_country_codes)
+mcp = FastMCP("Self-MCP", lifespan=lifespan)
+
+
+@lru_cache(maxsize=None)
+def read_only_annotations(title: str) -> ToolAnnotations:
+    """Shared read-only annotations, one instance per title"""
+    return ToolAnnotations(title=title, readOnlyHint=True)
+
+
+# Tools and their titles, registered with annotations for better LLM understanding
+TOOLS = [
+    # Core tools
+    (explain_self_integration, "Use this first to understand Self protocol integration"),
+    (generate_verification_code, "Generate ready-to-use code after understanding the integration"),
+    (debug_verification_error, "Debug Self verification errors with solutions"),
+    (check_self_status, "Check Self protocol network status and contracts"),
+    (generate_verification_config, "Generate complete verification configuration"),
+    (explain_sdk_setup, "Explain Self SDK setup requirements (IConfigStorage, UserIdType, etc.)"),
+    (generate_eu_id_verification, "Generate EU ID card verification code (V2 feature)"),
+    # Dynamic documentation tools
+    (fetch_self_docs, "Fetch latest Self protocol documentation from GitHub"),
+    (list_docs_topics, "List all available documentation topics"),
+    (search_docs, "Search through Self protocol documentation"),
+    # Contract interaction tools
+    (generate_scope_hash, "Generate scope hash for Self verification (like tools.self.xyz)"),
+    (generate_config_id, "Generate a configuration ID for Self protocol verification"),
+    (read_hub_config, "Read configuration from Self protocol Hub contract"),
+    (batch_check_configs, "Check whether several configuration IDs exist on the Hub contract"),
+    (guide_to_tools, "Guide users to appropriate tools.self.xyz features"),
+    (list_country_codes, "List available country codes for Self protocol exclusions"),
+]
+
+# All tools are read-only
+for tool, title in TOOLS:
+    mcp.tool(annotations=read_only_annotations(title))(tool)
 
 # Register resources
 mcp.resource("self://contracts/addresses")(get_contract_addresses)
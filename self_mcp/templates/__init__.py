@@ -0,0 +1,10 @@
+"""Code templates shipped with the Self MCP server"""
+
+from functools import lru_cache
+from importlib.resources import files
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str) -> str:
+    """Read a template file on first use and keep it in memory"""
+    return files(__name__).joinpath(name).read_text(encoding="utf-8")
\ No newline at end of file
@@ -0,0 +1,60 @@
+import { SelfBackendVerifier, AttestationId, UserIdType } from '@selfxyz/core';
+
+// Configuration storage implementation
+class SimpleConfigStorage {
+  async getConfig(configId) {
+    return {
+      olderThan: 18,
+      excludedCountries: ['IRN', 'PRK'],
+      ofac: true
+    };
+  }
+  
+  async getActionId(userIdentifier, userDefinedData) {
+    return 'default_config';
+  }
+}
+
+// Define allowed attestation types
+const allowedIds = new Map();
+allowedIds.set(1, true); // Passport
+allowedIds.set(2, true); // EU ID Card
+
+// Initialize verifier
+const selfBackendVerifier = new SelfBackendVerifier(
+  "my-app-scope",
+  "https://myapp.com/api/verify",
+  false, // Use real passports
+  allowedIds,
+  new SimpleConfigStorage(),
+  UserIdType.UUID
+);
+
+// Verify proof
+async function verifyProof(req, res) {
+  const { attestationId, proof, pubSignals, userContextData } = req.body;
+  
+  try {
+    const result = await selfBackendVerifier.verify(
+      attestationId,
+      proof,
+      pubSignals,
+      userContextData
+    );
+    
+    if (result.isValidDetails.isValid) {
+      res.json({
+        status: 'success',
+        userId: result.userData.userIdentifier,
+        details: result.discloseOutput
+      });
+    } else {
+      res.status(400).json({
+        status: 'error',
+        message: 'Verification failed'
+      });
+    }
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+}
\ No newline at end of file
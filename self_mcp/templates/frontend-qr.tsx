@@ -0,0 +1,32 @@
+import SelfQRcodeWrapper, { SelfAppBuilder } from '@selfxyz/qrcode';
+import { v4 as uuidv4 } from 'uuid';
+
+// Create Self app configuration
+const userId = uuidv4();
+const selfApp = new SelfAppBuilder({
+  appName: "My Application",
+  scope: "my-app-scope",
+  endpoint: "https://myapp.com/api/verify",
+  userId,
+  disclosures: {
+    minimumAge: 18,
+    excludedCountries: ['IRN', 'PRK'],
+    ofac: true,
+    name: true,
+    nationality: true
+  }
+}).build();
+
+// Render QR code component
+function VerificationComponent() {
+  return (
+    <SelfQRcodeWrapper
+      selfApp={selfApp}
+      onSuccess={() => {
+        console.log('Verification successful!');
+      }}
+    />
+  );
+}
+
+export default VerificationComponent;
\ No newline at end of file
@@ -0,0 +1,57 @@
+// SOLIDITY: On-chain Self Verification
+
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import "@openzeppelin/contracts/access/Ownable.sol";
+
+interface IHub {
+    function humanID(address human) external view returns (bool);
+    function verify(
+        uint256 scopeId,
+        uint256 nullifier,
+        uint256 modulus,
+        uint256[8] calldata proof
+    ) external returns (bool);
+}
+
+contract SelfVerifiedApp is Ownable {
+    IHub public immutable hub;
+    mapping(address => bool) public verifiedUsers;
+    
+    event UserVerified(address indexed user, uint256 timestamp);
+    
+    constructor(address _hub) {
+        hub = IHub(_hub);
+    }
+    
+    function verifyAndAccess(
+        uint256 scopeId,
+        uint256 nullifier,
+        uint256 modulus,
+        uint256[8] calldata proof
+    ) external {
+        // Verify proof through hub
+        require(
+            hub.verify(scopeId, nullifier, modulus, proof),
+            "Invalid proof"
+        );
+        
+        // Check if user has humanID
+        require(hub.humanID(msg.sender), "No humanID");
+        
+        // Mark user as verified
+        verifiedUsers[msg.sender] = true;
+        emit UserVerified(msg.sender, block.timestamp);
+    }
+    
+    modifier onlyVerified() {
+        require(verifiedUsers[msg.sender], "Not verified");
+        _;
+    }
+    
+    // Your app logic here
+    function accessProtectedFunction() external onlyVerified {
+        // Only verified users can access
+    }
+}
\ No newline at end of file
@@ -11,6 +11,7 @@ from .contract_interaction import (
     generate_scope_hash,
     generate_config_id,
     read_hub_config,
+    batch_check_configs,
     list_country_codes,
     guide_to_tools,
 )
@@ -26,6 +27,7 @@ __all__ = [
     "generate_scope_hash",
     "generate_config_id",
     "read_hub_config",
+    "batch_check_configs",
     "list_country_codes",
     "guide_to_tools",
 ]
\ No newline at end of file
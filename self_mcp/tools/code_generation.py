@@ -1,14 +1,54 @@
 """Tool for generating Self protocol integration code"""
 
-from typing import Literal, Optional
+import asyncio
+import re
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Literal, Optional, Set, Tuple
 from fastmcp import Context
 
+from ..templates import load_template
 from ..utils.github_client import get_docs_client
 
 
+# Map components to documentation files
+COMPONENT_DOCS = MappingProxyType({
+    "frontend-qr": "use-self/quickstart.md",
+    "backend-verify": "use-self/quickstart.md",
+    "smart-contract": "contract-integration/basic-integration.md"
+})
+
+# Generated code per (component, language): (fresh_until, stale_until, future resolving to the code)
+CODE_CACHE: Dict[Tuple[str, str], Tuple[float, float, asyncio.Future]] = {}
+CODE_CACHE_TTL_SECONDS = 3600
+# How long past its TTL an entry is still served while it is refreshed in the background
+CODE_CACHE_STALE_SECONDS = 3600
+CODE_CACHE_STATS = {"hits": 0, "misses": 0, "refreshes": 0}
+# Keys with a background refresh under way
+CODE_REFRESHING: Set[Tuple[str, str]] = set()
+
+# Full-line `//` comments, keeping SPDX license identifiers
+COMMENT_LINE_RE = re.compile(r"^[ \t]*//(?! SPDX-License-Identifier).*(?:\n|$)", re.MULTILINE)
+
+# Keywords marking the relevant doc section for each component, as one regex each
+SECTION_KEYWORD_RES = MappingProxyType({
+    component: re.compile("|".join(map(re.escape, keywords)))
+    for component, keywords in {
+        "frontend-qr": ("QRCodeGenerator", "SelfQRcode", "frontend", "QR code"),
+        "backend-verify": ("SelfBackendVerifier", "verify", "backend"),
+        "smart-contract": ("contract", "onchain", "solidity"),
+    }.items()
+})
+
+# Lines opening or closing a fenced code block, capturing the info string
+FENCE_LINE_RE = re.compile(r"^[^\S\n]*```(?P<info>.*)$", re.MULTILINE)
+
+
 async def generate_verification_code(
     component: Literal["frontend-qr", "backend-verify", "smart-contract"],
     language: Literal["typescript", "javascript", "solidity"] = "typescript",
+    concise: bool = False,
     ctx: Optional[Context] = None,
 ) -> str:
     """
@@ -17,40 +57,44 @@ async def generate_verification_code(
     Args:
         component: Which part to generate - 'frontend-qr', 'backend-verify', or 'smart-contract'
         language: Programming language - 'typescript', 'javascript', or 'solidity'
+        concise: Strip full-line comments to return shorter code
         
     Returns:
         Complete, working code example with comments
     """
-    client = get_docs_client()
-    
-    # Map components to documentation files
-    component_map = {
-        "frontend-qr": "use-self/quickstart.md",
-        "backend-verify": "use-self/quickstart.md", 
-        "smart-contract": "contract-integration/basic-integration.md"
-    }
-    
     # Handle language compatibility
     if component == "smart-contract" and language != "solidity":
         language = "solidity"  # Force solidity for smart contracts
     elif component != "smart-contract" and language == "solidity":
         language = "typescript"  # Default to typescript for non-contracts
     
-    # Fetch the documentation
-    doc_path = component_map.get(component)
+    doc_path = COMPONENT_DOCS.get(component)
     if not doc_path:
-        return f"Unknown component: {component}. Available: frontend-qr, backend-verify, smart-contract"
-    
-    content = await client.fetch_document(doc_path)
-    if not content:
+        return f"Unknown component: {component}. Available: {', '.join(COMPONENT_DOCS)}"
+    
+    # Serve repeat requests from the result cache; concurrent callers share one build
+    key = (component, language)
+    now = time.monotonic()
+    cached = CODE_CACHE.get(key)
+    if cached and now < cached[1]:
+        CODE_CACHE_STATS["hits"] += 1
+        future = cached[2]
+        # Stale but usable: answer now and refresh in the background
+        if now >= cached[0] and future.done() and key not in CODE_REFRESHING:
+            CODE_CACHE_STATS["refreshes"] += 1
+            CODE_REFRESHING.add(key)
+            start_code_build(key, doc_path, refresh=True)
+    else:
+        CODE_CACHE_STATS["misses"] += 1
+        future = start_code_build(key, doc_path, refresh=False)
+        CODE_CACHE[key] = code_cache_entry(future)
+    
+    code_example = await asyncio.shield(future)
+    if code_example is None:
         return f"Failed to fetch documentation for {component}. Please try again later."
     
-    # Extract relevant code sections based on component
-    code_example = extract_code_example(content, component, language)
-    
-    if not code_example:
-        # Fallback to basic examples
-        code_example = generate_basic_example(component, language)
+    if concise:
+        code_example = strip_comments(code_example)
     
     # Log to context if available (FastMCP 2.0 feature)
     if ctx:
@@ -59,46 +103,104 @@ async def generate_verification_code(
     return code_example
 
 
-def extract_code_example(content: str, component: str, language: str) -> str:
-    """Extract code example from documentation content"""
-    lines = content.split('\n')
-    in_code_block = False
-    code_lines = []
-    found_relevant_section = False
+async def build_code_example(doc_path: str, component: str, language: str) -> Optional[str]:
+    """Fetch the component's docs and extract its code, or None if the fetch fails"""
+    content = await get_docs_client().fetch_document(doc_path)
+    if not content:
+        return None
     
-    # Keywords to look for based on component
-    section_keywords = {
-        "frontend-qr": ["QRCodeGenerator", "SelfQRcode", "frontend", "QR code"],
-        "backend-verify": ["SelfBackendVerifier", "verify", "backend"],
-        "smart-contract": ["contract", "onchain", "solidity"]
-    }
+    # Extract relevant code sections based on component, off the event loop
+    code_example = await asyncio.to_thread(extract_code_example, content, component, language)
     
-    for i, line in enumerate(lines):
-        # Check if we're in a relevant section
-        if any(keyword in line for keyword in section_keywords[component]):
-            found_relevant_section = True
-        
-        # Look for code blocks
-        if line.strip().startswith('```') and found_relevant_section:
-            if not in_code_block:
-                # Check if it's the right language
-                lang_marker = line.strip().replace('```', '').lower()
-                if lang_marker in [language, language[:2], 'js', 'ts'] or (component == "smart-contract" and lang_marker == "solidity"):
-                    in_code_block = True
-            else:
-                # End of code block
-                if code_lines:
-                    return '\n'.join(code_lines)
-                in_code_block = False
-                code_lines = []
-        elif in_code_block:
-            code_lines.append(line)
+    if not code_example:
+        # Fallback to basic examples
+        code_example = generate_basic_example(component, language)
+    
+    return code_example
+
+
+def code_cache_entry(future: asyncio.Future) -> Tuple[float, float, asyncio.Future]:
+    """Build a cache entry that is fresh for the TTL, then stale for a grace period"""
+    fresh_until = time.monotonic() + CODE_CACHE_TTL_SECONDS
+    return (fresh_until, fresh_until + CODE_CACHE_STALE_SECONDS, future)
+
+
+def start_code_build(key: Tuple[str, str], doc_path: str, refresh: bool) -> asyncio.Future:
+    """Start building the code for a cache key in a background task"""
+    component, language = key
+    future = asyncio.ensure_future(build_code_example(doc_path, component, language))
+    future.add_done_callback(lambda done: _finish_code_build(key, done, refresh))
+    return future
+
+
+def _finish_code_build(key: Tuple[str, str], future: asyncio.Future, refresh: bool):
+    """Cache a successful refresh; drop a failed first build so the next call retries"""
+    CODE_REFRESHING.discard(key)
+    failed = future.cancelled() or future.exception() is not None or future.result() is None
+    if refresh:
+        # A failed refresh keeps serving the stale entry until it runs out
+        if not failed:
+            CODE_CACHE[key] = code_cache_entry(future)
+    elif failed and key in CODE_CACHE and CODE_CACHE[key][2] is future:
+        del CODE_CACHE[key]
+
+
+def get_code_cache_stats() -> Dict[str, Any]:
+    """Get generated code cache statistics"""
+    now = time.monotonic()
+    valid_count = sum(1 for fresh_until, _, _ in CODE_CACHE.values() if now < fresh_until)
+    return {
+        **CODE_CACHE_STATS,
+        "total_cached": len(CODE_CACHE),
+        "valid_cached": valid_count,
+        "cache_ttl_seconds": CODE_CACHE_TTL_SECONDS,
+        "stale_seconds": CODE_CACHE_STALE_SECONDS
+    }
+
+
+@lru_cache(maxsize=64)
+def extract_code_example(content: str, component: str, language: str) -> str:
+    """Extract code example from documentation content (memoized per doc/component/language)"""
+    # Skip straight to the first line mentioning the component
+    match = SECTION_KEYWORD_RES[component].search(content)
+    if not match:
+        return None
+    
+    # Walk the fence lines from there; a block runs to the next fence line
+    aliases = language_aliases(component, language)
+    block_start = None
+    for fence in FENCE_LINE_RE.finditer(content, content.rfind('\n', 0, match.start()) + 1):
+        if block_start is None:
+            # Check if it's the right language
+            lang_marker = fence["info"].rstrip().replace('```', '').lower()
+            if lang_marker in aliases:
+                block_start = fence.end() + 1
+        else:
+            # End of code block
+            if fence.start() > block_start:
+                return content[block_start:fence.start() - 1]
+            block_start = None
     
     return None
 
 
+@lru_cache(maxsize=None)
+def language_aliases(component: str, language: str) -> FrozenSet[str]:
+    """Code fence languages accepted for a component/language pair"""
+    aliases = {language, language[:2], 'js', 'ts'}
+    if component == "smart-contract":
+        aliases.add("solidity")
+    return frozenset(aliases)
+
+
+def strip_comments(code: str) -> str:
+    """Remove full-line `//` comments from generated code"""
+    return COMMENT_LINE_RE.sub("", code)
+
+
+@lru_cache(maxsize=16)
 def generate_basic_example(component: str, language: str) -> str:
-    """Generate basic example if extraction fails"""
+    """Generate basic example if extraction fails (memoized per component/language)"""
     if component == "frontend-qr":
         return _generate_frontend_example(language)
     elif component == "backend-verify":
@@ -109,164 +211,14 @@ def generate_basic_example(component: str, language: str) -> str:
 
 def _generate_frontend_example(language: str) -> str:
     """Generate frontend QR code example"""
-    return f"""// {language.upper()}: Self Verification QR Code Component
-
-import SelfQRcodeWrapper, {{ SelfAppBuilder }} from '@selfxyz/qrcode';
-import {{ v4 as uuidv4 }} from 'uuid';
-
-// Create Self app configuration
-const userId = uuidv4();
-const selfApp = new SelfAppBuilder({{
-  appName: "My Application",
-  scope: "my-app-scope",
-  endpoint: "https://myapp.com/api/verify",
-  userId,
-  disclosures: {{
-    minimumAge: 18,
-    excludedCountries: ['IRN', 'PRK'],
-    ofac: true,
-    name: true,
-    nationality: true
-  }}
-}}).build();
-
-// Render QR code component
-function VerificationComponent() {{
-  return (
-    <SelfQRcodeWrapper
-      selfApp={{selfApp}}
-      onSuccess={{() => {{
-        console.log('Verification successful!');
-      }}}}
-    />
-  );
-}}
-
-export default VerificationComponent;"""
+    return f"// {language.upper()}: Self Verification QR Code Component\n\n{load_template('frontend-qr.tsx')}"
 
 
 def _generate_backend_example(language: str) -> str:
     """Generate backend verification example"""
-    return f"""// {language.upper()}: Self Backend Verification
-
-import {{ SelfBackendVerifier, AttestationId, UserIdType }} from '@selfxyz/core';
-
-// Configuration storage implementation
-class SimpleConfigStorage {{
-  async getConfig(configId) {{
-    return {{
-      olderThan: 18,
-      excludedCountries: ['IRN', 'PRK'],
-      ofac: true
-    }};
-  }}
-  
-  async getActionId(userIdentifier, userDefinedData) {{
-    return 'default_config';
-  }}
-}}
-
-// Define allowed attestation types
-const allowedIds = new Map();
-allowedIds.set(1, true); // Passport
-allowedIds.set(2, true); // EU ID Card
-
-// Initialize verifier
-const selfBackendVerifier = new SelfBackendVerifier(
-  "my-app-scope",
-  "https://myapp.com/api/verify",
-  false, // Use real passports
-  allowedIds,
-  new SimpleConfigStorage(),
-  UserIdType.UUID
-);
-
-// Verify proof
-async function verifyProof(req, res) {{
-  const {{ attestationId, proof, pubSignals, userContextData }} = req.body;
-  
-  try {{
-    const result = await selfBackendVerifier.verify(
-      attestationId,
-      proof,
-      pubSignals,
-      userContextData
-    );
-    
-    if (result.isValidDetails.isValid) {{
-      res.json({{
-        status: 'success',
-        userId: result.userData.userIdentifier,
-        details: result.discloseOutput
-      }});
-    }} else {{
-      res.status(400).json({{
-        status: 'error',
-        message: 'Verification failed'
-      }});
-    }}
-  }} catch (error) {{
-    res.status(500).json({{ error: error.message }});
-  }}
-}}"""
+    return f"// {language.upper()}: Self Backend Verification\n\n{load_template('backend-verify.ts')}"
 
 
 def _generate_smart_contract_example() -> str:
     """Generate smart contract example"""
-    return """// SOLIDITY: On-chain Self Verification
-
-// SPDX-License-Identifier: MIT
-pragma solidity ^0.8.20;
-
-import "@openzeppelin/contracts/access/Ownable.sol";
-
-interface IHub {
-    function humanID(address human) external view returns (bool);
-    function verify(
-        uint256 scopeId,
-        uint256 nullifier,
-        uint256 modulus,
-        uint256[8] calldata proof
-    ) external returns (bool);
-}
-
-contract SelfVerifiedApp is Ownable {
-    IHub public immutable hub;
-    mapping(address => bool) public verifiedUsers;
-    
-    event UserVerified(address indexed user, uint256 timestamp);
-    
-    constructor(address _hub) {
-        hub = IHub(_hub);
-    }
-    
-    function verifyAndAccess(
-        uint256 scopeId,
-        uint256 nullifier,
-        uint256 modulus,
-        uint256[8] calldata proof
-    ) external {
-        // Verify proof through hub
-        require(
-            hub.verify(scopeId, nullifier, modulus, proof),
-            "Invalid proof"
-        );
-        
-        // Check if user has humanID
-        require(hub.humanID(msg.sender), "No humanID");
-        
-        // Mark user as verified
-        verifiedUsers[msg.sender] = true;
-        emit UserVerified(msg.sender, block.timestamp);
-    }
-    
-    modifier onlyVerified() {
-        require(verifiedUsers[msg.sender], "Not verified");
-        _;
-    }
-    
-    // Your app logic here
-    function accessProtectedFunction() external onlyVerified {
-        // Only verified users can access
-    }
-}"""
\ No newline at end of file
+    return load_template("smart-contract.sol")
\ No newline at end of file
@@ -4,6 +4,23 @@ import json
 from typing import Any, Dict
 
 
+# requirement key -> (frontend disclosure, disclosed value, backend verifier call)
+REQUIREMENT_CHECKS = (
+    ("minimum_age", "minimumAge", lambda age: age, lambda age: f"verifier.setMinimumAge({age})"),
+    ("nationality_check", "nationality", lambda _: True, lambda nationality: f"verifier.setNationality('{nationality}')"),
+    ("exclude_countries", "excludedCountries", lambda countries: countries, lambda countries: f"verifier.excludeCountries({json.dumps(list(countries))[1:-1]})"),
+    ("ofac_check", "ofac", lambda _: True, lambda _: "verifier.enableNameAndDobOfacCheck()"),
+)
+
+
+def to_js_object(values: Dict[str, Any]) -> str:
+    """Render a flat dict as a JavaScript object literal with unquoted keys"""
+    if not values:
+        return "{}"
+    fields = ",\n".join(f"  {key}: {json.dumps(value)}" for key, value in values.items())
+    return f"{{\n{fields}\n}}"
+
+
 async def generate_verification_config(
     requirements: Dict[str, Any]
 ) -> str:
@@ -20,23 +37,11 @@ async def generate_verification_config(
     }
     
     # Build configuration based on requirements
-    if requirements.get("minimum_age"):
-        config["frontend"]["disclosures"]["minimumAge"] = requirements["minimum_age"]
-        config["backend"]["checks"].append(f"verifier.setMinimumAge({requirements['minimum_age']})")
-    
-    if requirements.get("nationality_check"):
-        config["frontend"]["disclosures"]["nationality"] = True
-        config["backend"]["checks"].append(f"verifier.setNationality('{requirements['nationality_check']}')")
-    
-    if requirements.get("exclude_countries"):
-        countries = requirements["exclude_countries"]
-        config["frontend"]["disclosures"]["excludedCountries"] = countries
-        escaped_countries = ', '.join(json.dumps(c) for c in countries)
-        config["backend"]["checks"].append(f"verifier.excludeCountries({escaped_countries})")
-    
-    if requirements.get("ofac_check"):
-        config["frontend"]["disclosures"]["ofac"] = True
-        config["backend"]["checks"].append("verifier.enableNameAndDobOfacCheck()")
+    for requirement, disclosure, disclosed_value, backend_check in REQUIREMENT_CHECKS:
+        value = requirements.get(requirement)
+        if value:
+            config["frontend"]["disclosures"][disclosure] = disclosed_value(value)
+            config["backend"]["checks"].append(backend_check(value))
     
     return f"""## Generated Self Verification Configuration
 
@@ -46,7 +51,7 @@ const selfApp = new SelfAppBuilder({{
   appName: '{requirements.get('app_name', 'My Application')}',
   scope: '{config['frontend']['scope']}',
   endpoint: '{requirements.get('endpoint', '/api/verify')}',
-  disclosures: {json.dumps(config['frontend']['disclosures'], indent=2).replace('"', '')}
+  disclosures: {to_js_object(config['frontend']['disclosures'])}
 }}).build();
 ```
 
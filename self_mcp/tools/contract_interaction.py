@@ -1,28 +1,51 @@
 """Tools for interacting with Self protocol smart contracts."""
 
-import json
-from typing import Any, Dict, List, Literal, Optional
-
-from eth_utils import is_address
+import copy
+import re
+import struct
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlencode
+
+from eth_hash.auto import keccak
 from pydantic import Field
-from web3 import Web3
 
 from ..utils.constants import (
     COUNTRY_CODES,
     MAX_COUNTRIES_LENGTH,
     BYTES_PER_UINT256,
-    COUNTRIES_PER_UINT256,
     COUNTRY_CODE_LENGTH,
     MIN_AGE,
     MAX_AGE,
     DEFAULT_OFAC_SETTINGS,
 )
-from ..utils.constants_abi import HUB_CONTRACT_ABI
+from ..utils.hub_client import get_hub_contract, get_web3
 from ..utils.networks import CELO_NETWORKS
 
 
-def format_countries_list(countries: List[str]) -> List[int]:
-    """Formats a list of 3-letter country codes into a list of integers for packing."""
+# abi.encodePacked layout of the Hub's VerificationConfigV2:
+# bool olderThanEnabled, uint256 olderThan, bool forbiddenCountriesEnabled,
+# uint256[4] forbiddenCountriesListPacked, bool[3] ofacEnabled
+CONFIG_PACK_FORMAT = ">?32s?128s3?"
+
+# Characters allowed in a scope seed: lowercase ASCII, digits and " -_.,!?"
+SCOPE_SEED_RE = re.compile(r"[a-z0-9 \-_.,!?]*")
+
+# Decoded Hub configs per (config_id, network): (expires_at, result)
+HUB_CONFIG_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+HUB_CONFIG_CACHE_TTL_SECONDS = 300
+HUB_CONFIG_CACHE_MAX_ENTRIES = 1024
+
+# Country codes sorted by code, with lowercased copies for searching
+COUNTRY_INDEX = tuple(
+    (code.lower(), name.lower(), code, name)
+    for code, name in sorted(COUNTRY_CODES.items())
+)
+
+
+def format_countries_list(countries: List[str]) -> bytes:
+    """Formats a list of 3-letter country codes into the packed byte string for the contract."""
     if len(countries) > MAX_COUNTRIES_LENGTH:
         raise ValueError(f"Maximum {MAX_COUNTRIES_LENGTH} countries allowed")
     
@@ -31,41 +54,41 @@ def format_countries_list(countries: List[str]) -> List[int]:
         if len(country) != COUNTRY_CODE_LENGTH:
             raise ValueError(f"Invalid country code: {country}. Must be {COUNTRY_CODE_LENGTH} characters.")
     
-    # Pad the list to MAX_COUNTRIES_LENGTH
-    padded = countries + [''] * (MAX_COUNTRIES_LENGTH - len(countries))
-    
-    # Convert to bytes
-    result = []
-    for country in padded:
-        chars = country.ljust(COUNTRY_CODE_LENGTH, '\0')
-        result.extend([ord(c) for c in chars])
-    
-    return result
+    # One byte per character, zero-padded to MAX_COUNTRIES_LENGTH codes
+    packed = "".join(countries).encode("latin-1")
+    return packed.ljust(MAX_COUNTRIES_LENGTH * COUNTRY_CODE_LENGTH, b"\0")
 
 
 def unpack_countries_from_config(packed_countries: List[int]) -> List[str]:
     """Unpacks the country list from the smart contract format."""
     countries = []
     
-    # Each uint256 contains up to BYTES_PER_UINT256 characters (COUNTRIES_PER_UINT256 countries)
+    # Each uint256 holds BYTES_PER_UINT256 little-endian bytes (COUNTRIES_PER_UINT256 countries)
     for packed_value in packed_countries:
-        # Convert the packed value to bytes
-        for i in range(COUNTRIES_PER_UINT256):
-            # Extract COUNTRY_CODE_LENGTH characters for each country
-            country = ""
-            for j in range(COUNTRY_CODE_LENGTH):
-                byte_index = i * COUNTRY_CODE_LENGTH + j
-                char_code = (packed_value >> (byte_index * 8)) & 0xFF
-                if char_code == 0:
-                    break
-                country += chr(char_code)
-            
-            if country and country != '\0' * COUNTRY_CODE_LENGTH:
-                countries.append(country)
+        raw = packed_value.to_bytes(32, 'little')
+        for i in range(0, BYTES_PER_UINT256, COUNTRY_CODE_LENGTH):
+            # A code ends at its first zero byte, searched within its own slot
+            end = raw.find(b"\0", i, i + COUNTRY_CODE_LENGTH)
+            if end < 0:
+                end = i + COUNTRY_CODE_LENGTH
+            if end > i:
+                countries.append(raw[i:end].decode("latin-1"))
     
     return countries
 
 
+def parse_config_id(config_id: str) -> Optional[bytes]:
+    """Decode a 0x-prefixed config ID to its 32 bytes, or None if it is malformed"""
+    if not config_id.startswith("0x") or len(config_id) != 66:
+        return None
+    try:
+        config_id_bytes = bytes.fromhex(config_id[2:])
+    except ValueError:
+        return None
+    # fromhex skips whitespace, so 64 characters can still decode short
+    return config_id_bytes if len(config_id_bytes) == 32 else None
+
+
 async def generate_scope_hash(
     address_or_url: str = Field(description="Ethereum address (0x...) or HTTPS URL"),
     scope_seed: str = Field(description="Scope seed string (max 20 chars, lowercase)")
@@ -86,6 +109,9 @@ async def generate_scope_hash(
     
     # Validate address_or_url
     if address_or_url.startswith("0x"):
+        # eth_utils is slow to import, so only load it when an address is given
+        from eth_utils import is_address
+        
         if is_address(address_or_url):
             input_type = "address"
         else:
@@ -103,7 +129,7 @@ async def generate_scope_hash(
         errors.append("Scope seed cannot be empty")
     elif len(scope_seed) > 20:
         errors.append("Scope seed must be 20 characters or less")
-    elif not all(c.islower() or c.isdigit() or c in " -_.,!?" for c in scope_seed):
+    elif not SCOPE_SEED_RE.fullmatch(scope_seed):
         errors.append("Scope seed must contain only lowercase ASCII characters")
     
     if errors:
@@ -117,7 +143,7 @@ async def generate_scope_hash(
     # Generate the hash (keccak256 of concatenated values)
     # This replicates the hashEndpointWithScope function
     combined = address_or_url.lower() + scope_seed
-    scope_hash = Web3.keccak(text=combined).hex()
+    scope_hash = "0x" + keccak(combined.encode("utf-8")).hex()
     
     return {
         "scope_hash": scope_hash,
@@ -129,6 +155,41 @@ async def generate_scope_hash(
     }
 
 
+@lru_cache(maxsize=4096)
+def compute_config_id(minimum_age: int, excluded_countries: Tuple[str, ...], ofac_enabled: Tuple[bool, ...]) -> str:
+    """Compute the config ID for a verification config, as the Hub's generateConfigId does"""
+    # Create the config struct matching Solidity
+    config = {
+        "olderThanEnabled": minimum_age > 0,
+        "olderThan": minimum_age,
+        "forbiddenCountriesEnabled": len(excluded_countries) > 0,
+        "forbiddenCountriesListPacked": [0, 0, 0, 0],
+        "ofacEnabled": ofac_enabled
+    }
+    
+    # Pack countries if provided
+    if excluded_countries:
+        country_bytes = format_countries_list(list(excluded_countries))
+        # Pack into four uint256 values, BYTES_PER_UINT256 little-endian bytes each
+        config["forbiddenCountriesListPacked"] = [
+            int.from_bytes(country_bytes[i:i + BYTES_PER_UINT256], 'little')
+            for i in range(0, 4 * BYTES_PER_UINT256, BYTES_PER_UINT256)
+        ]
+    
+    # Generate config ID using keccak256
+    # Pack the data according to Solidity's abi.encodePacked
+    packed_data = struct.pack(
+        CONFIG_PACK_FORMAT,
+        config["olderThanEnabled"],
+        config["olderThan"].to_bytes(32, 'big'),
+        config["forbiddenCountriesEnabled"],
+        b"".join(packed_country.to_bytes(32, 'big') for packed_country in config["forbiddenCountriesListPacked"]),
+        *config["ofacEnabled"]
+    )
+    
+    return "0x" + keccak(packed_data).hex()
+
+
 async def generate_config_id(
     minimum_age: int = Field(default=0, description="Minimum age requirement (0 to disable)"),
     excluded_countries: List[str] = Field(default_factory=list, description="List of excluded 3-letter country codes"),
@@ -147,69 +208,30 @@ async def generate_config_id(
     if len(ofac_enabled) != len(DEFAULT_OFAC_SETTINGS):
         ofac_enabled = DEFAULT_OFAC_SETTINGS
     
-    # Create the config struct matching Solidity
-    config = {
-        "olderThanEnabled": minimum_age > 0,
-        "olderThan": minimum_age,
-        "forbiddenCountriesEnabled": len(excluded_countries) > 0,
-        "forbiddenCountriesListPacked": [0, 0, 0, 0],
-        "ofacEnabled": ofac_enabled
-    }
-    
-    # Pack countries if provided
-    if excluded_countries:
-        try:
-            country_bytes = format_countries_list(excluded_countries)
-            # Pack into four uint256 values
-            for i in range(4):
-                packed_value = 0
-                for j in range(BYTES_PER_UINT256):
-                    byte_index = i * BYTES_PER_UINT256 + j
-                    if byte_index < len(country_bytes):
-                        packed_value |= country_bytes[byte_index] << (j * 8)
-                config["forbiddenCountriesListPacked"][i] = packed_value
-        except ValueError as e:
-            return {"error": str(e)}
-    
-    # Generate config ID using keccak256
-    # Pack the data according to Solidity's abi.encodePacked
-    packed_data = bytearray()
-    
-    # bool olderThanEnabled
-    packed_data.extend(config["olderThanEnabled"].to_bytes(1, 'big'))
-    # uint256 olderThan
-    packed_data.extend(config["olderThan"].to_bytes(32, 'big'))
-    # bool forbiddenCountriesEnabled  
-    packed_data.extend(config["forbiddenCountriesEnabled"].to_bytes(1, 'big'))
-    # uint256[4] forbiddenCountriesListPacked
-    for packed_country in config["forbiddenCountriesListPacked"]:
-        packed_data.extend(packed_country.to_bytes(32, 'big'))
-    # bool[3] ofacEnabled
-    for ofac in config["ofacEnabled"]:
-        packed_data.extend(ofac.to_bytes(1, 'big'))
-    
-    config_id = Web3.keccak(bytes(packed_data)).hex()
+    try:
+        config_id = compute_config_id(minimum_age, tuple(excluded_countries), tuple(ofac_enabled))
+    except ValueError as e:
+        return {"error": str(e)}
     
     # Check if config exists on chain
     exists_on_chain = False
     try:
-        w3 = Web3(Web3.HTTPProvider(CELO_NETWORKS[network]["rpc"]))
-        hub_address = CELO_NETWORKS[network]["contracts"]["hub"]
-        hub_contract = w3.eth.contract(address=hub_address, abi=json.loads(HUB_CONTRACT_ABI))
+        hub_contract = get_hub_contract(network)
         exists_on_chain = hub_contract.functions.verificationConfigV2Exists(config_id).call()
     except Exception as e:
         print(f"Error checking config existence: {e}")
     
     # Generate URL parameters for tools.self.xyz
-    url_params = []
+    url_params = {}
     if minimum_age > 0:
-        url_params.append(f"age={minimum_age}")
+        url_params["age"] = minimum_age
     if excluded_countries:
-        url_params.append(f"countries={','.join(excluded_countries)}")
+        url_params["countries"] = ",".join(excluded_countries)
     if any(ofac_enabled):
-        url_params.append(f"ofac={','.join(str(o).lower() for o in ofac_enabled)}")
+        url_params["ofac"] = ",".join(str(o).lower() for o in ofac_enabled)
     
-    deploy_url = f"https://tools.self.xyz/?{('&'.join(url_params))}"
+    query = urlencode(url_params, safe=",")
+    deploy_url = f"https://tools.self.xyz/?{query}" if query else "https://tools.self.xyz/"
     
     return {
         "config_id": config_id,
@@ -236,18 +258,24 @@ async def read_hub_config(
     """
     Read configuration from Self protocol Hub contract with full decoding.
     """
-    # Validate config ID
-    if not config_id.startswith("0x") or len(config_id) != 66:
+    # Validate config ID; the contract calls take the decoded bytes32 directly
+    config_id_bytes = parse_config_id(config_id)
+    if config_id_bytes is None:
         return {"error": "Invalid config ID format. Must be 0x followed by 64 hex characters."}
     
+    # Deployed configs don't change, so recent reads are served from the cache
+    cache_key = (config_id.lower(), network)
+    cached = HUB_CONFIG_CACHE.get(cache_key)
+    if cached and time.monotonic() < cached[0]:
+        return {**copy.deepcopy(cached[1]), "config_id": config_id}
+    
     try:
         # Set up web3 connection
-        w3 = Web3(Web3.HTTPProvider(CELO_NETWORKS[network]["rpc"]))
         hub_address = CELO_NETWORKS[network]["contracts"]["hub"]
-        hub_contract = w3.eth.contract(address=hub_address, abi=json.loads(HUB_CONTRACT_ABI))
+        hub_contract = get_hub_contract(network)
         
         # Check if config exists
-        exists = hub_contract.functions.verificationConfigV2Exists(config_id).call()
+        exists = hub_contract.functions.verificationConfigV2Exists(config_id_bytes).call()
         if not exists:
             return {
                 "error": f"Configuration {config_id} does not exist on {network}",
@@ -257,7 +285,7 @@ async def read_hub_config(
             }
         
         # Read config from the contract
-        config = hub_contract.functions.getVerificationConfigV2(config_id).call()
+        config = hub_contract.functions.getVerificationConfigV2(config_id_bytes).call()
         
         # Unpack the response
         older_than_enabled = config[0]
@@ -277,7 +305,7 @@ async def read_hub_config(
                 for code in excluded_countries
             ]
         
-        return {
+        result = {
             "config_id": config_id,
             "network": network,
             "exists": True,
@@ -305,6 +333,8 @@ async def read_hub_config(
             "hub_address": hub_address,
             "explorer_url": f"{CELO_NETWORKS[network]['explorer']}/address/{hub_address}"
         }
+        cache_hub_config(cache_key, result)
+        return copy.deepcopy(result)
         
     except ValueError as e:
         return {
@@ -326,6 +356,57 @@ async def read_hub_config(
         }
 
 
+def cache_hub_config(key: Tuple[str, str], result: Dict[str, Any]):
+    """Cache a decoded Hub config, evicting the oldest entry when full"""
+    HUB_CONFIG_CACHE.pop(key, None)
+    if len(HUB_CONFIG_CACHE) >= HUB_CONFIG_CACHE_MAX_ENTRIES:
+        del HUB_CONFIG_CACHE[next(iter(HUB_CONFIG_CACHE))]
+    HUB_CONFIG_CACHE[key] = (time.monotonic() + HUB_CONFIG_CACHE_TTL_SECONDS, result)
+
+
+async def batch_check_configs(
+    config_ids: List[str] = Field(description="Configuration IDs to check (0x...)"),
+    network: Literal["mainnet", "testnet"] = Field(default="mainnet", description="Network to check")
+) -> Dict[str, Any]:
+    """
+    Check whether several configuration IDs exist on the Hub contract in one RPC round-trip.
+    """
+    # Validate config IDs
+    invalid = [config_id for config_id in config_ids if parse_config_id(config_id) is None]
+    if invalid:
+        return {
+            "error": "Invalid config ID format. Must be 0x followed by 64 hex characters.",
+            "invalid_config_ids": invalid
+        }
+    
+    unique_ids = list(dict.fromkeys(config_ids))
+    if not unique_ids:
+        return {"network": network, "results": {}, "existing_count": 0}
+    
+    try:
+        w3 = get_web3(network)
+        hub_contract = get_hub_contract(network)
+        
+        # Send every existence check as a single JSON-RPC batch
+        with w3.batch_requests() as batch:
+            for config_id in unique_ids:
+                batch.add(hub_contract.functions.verificationConfigV2Exists(parse_config_id(config_id)))
+            exists = batch.execute()
+        
+    except Exception as e:
+        return {
+            "error": f"Unexpected error checking configs: {str(e)}",
+            "network": network
+        }
+    
+    results = dict(zip(unique_ids, exists))
+    return {
+        "network": network,
+        "results": results,
+        "existing_count": sum(1 for found in results.values() if found)
+    }
+
+
 async def list_country_codes(
     search: Optional[str] = Field(default=None, description="Search term to filter countries")
 ) -> List[Dict[str, str]]:
@@ -334,18 +415,16 @@ async def list_country_codes(
     
     Returns ISO 3166-1 alpha-3 country codes with their names.
     """
+    if not search:
+        return [{"code": code, "name": name} for _, _, code, name in COUNTRY_INDEX]
     
-    # Filter results if search term provided
-    results = []
-    for code, name in sorted(COUNTRY_CODES.items()):
-        if search:
-            search_lower = search.lower()
-            if search_lower in code.lower() or search_lower in name.lower():
-                results.append({"code": code, "name": name})
-        else:
-            results.append({"code": code, "name": name})
-    
-    return results
+    # Filter results by search term
+    search_lower = search.lower()
+    return [
+        {"code": code, "name": name}
+        for code_lower, name_lower, code, name in COUNTRY_INDEX
+        if search_lower in code_lower or search_lower in name_lower
+    ]
 
 
 async def guide_to_tools(
@@ -362,19 +441,21 @@ async def guide_to_tools(
     if action == "deploy-config":
         if parameters:
             # Build URL with parameters
-            url_params = []
+            url_params = {}
             if "minimum_age" in parameters:
-                url_params.append(f"age={parameters['minimum_age']}")
+                url_params["age"] = parameters['minimum_age']
             if "excluded_countries" in parameters:
                 countries = parameters['excluded_countries']
                 if isinstance(countries, list):
-                    url_params.append(f"countries={','.join(countries)}")
+                    url_params["countries"] = ",".join(countries)
             if "ofac_enabled" in parameters:
                 ofac = parameters['ofac_enabled']
                 if isinstance(ofac, list):
-                    url_params.append(f"ofac={','.join(str(o).lower() for o in ofac)}")
+                    url_params["ofac"] = ",".join(str(o).lower() for o in ofac)
             
-            url = f"{base_url}?{'&'.join(url_params)}" if url_params else base_url
+            # Values are percent-encoded; commas stay readable
+            query = urlencode(url_params, safe=",")
+            url = f"{base_url}?{query}" if query else base_url
             
             return f"""## Deploy Configuration to Self Protocol
 
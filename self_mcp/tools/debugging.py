@@ -1,8 +1,34 @@
 """Tool for debugging Self protocol verification errors"""
 
-from typing import Literal, Optional
+import re
+from types import MappingProxyType
+from typing import List, Literal, Mapping, Optional, Tuple
 
 from ..utils.github_client import get_docs_client
+from ..utils.markdown import split_lines, split_lower_lines
+
+
+# Keywords that map an error message to a troubleshooting category
+ERROR_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "scope": ("scope", "mismatch"),
+    "proof": ("proof", "invalid", "verification failed"),
+    "age": ("age", "older", "minimum age"),
+    "nullifier": ("nullifier", "reuse", "duplicate"),
+    "network": ("network", "connection", "timeout"),
+    "config": ("config", "mismatch", "configuration"),
+})
+
+# Inverted index: keyword -> categories it belongs to
+KEYWORD_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    keyword: tuple(category for category, keywords in ERROR_KEYWORDS.items() if keyword in keywords)
+    for keywords in ERROR_KEYWORDS.values()
+    for keyword in keywords
+})
+
+# Every keyword as one alternation; the lookahead finds overlapping matches too
+KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(KEYWORD_CATEGORIES, key=len, reverse=True))) + "))"
+)
 
 
 async def debug_verification_error(
@@ -40,7 +66,6 @@ async def debug_verification_error(
 
 def find_error_solution(content: str, error_message: str, context: str) -> str:
     """Find error solution in troubleshooting documentation"""
-    lines = content.split('\n')
     error_lower = error_message.lower()
     
     # Keywords to search for based on error/context
@@ -49,34 +74,29 @@ def find_error_solution(content: str, error_message: str, context: str) -> str:
         search_terms.append(context.replace('-', ' '))
     
     # Extract keywords from error message
-    error_keywords = {
-        "scope": ["scope", "mismatch"],
-        "proof": ["proof", "invalid", "verification failed"],
-        "age": ["age", "older", "minimum age"],
-        "nullifier": ["nullifier", "reuse", "duplicate"],
-        "network": ["network", "connection", "timeout"],
-        "config": ["config", "mismatch", "configuration"]
-    }
+    for category in match_error_categories(error_lower):
+        search_terms.extend(ERROR_KEYWORDS[category])
     
-    for key, keywords in error_keywords.items():
-        if any(kw in error_lower for kw in keywords):
-            search_terms.extend(keywords)
+    if not search_terms:
+        return None
+    # One alternation finds any term in a line in a single pass (re caches the compiled pattern)
+    terms_re = re.compile("|".join(map(re.escape, search_terms)))
     
     # Find relevant sections
     relevant_sections = []
     current_section = []
     section_relevance = 0
     
-    for line in lines:
+    for line, line_lower in zip(split_lines(content), split_lower_lines(content)):
         if line.startswith('#'):
             # New section
             if current_section and section_relevance > 0:
                 relevant_sections.append(('\n'.join(current_section), section_relevance))
             current_section = [line]
-            section_relevance = sum(1 for term in search_terms if term in line.lower())
+            section_relevance = sum(1 for term in search_terms if term in line_lower)
         else:
             current_section.append(line)
-            if any(term in line.lower() for term in search_terms):
+            if terms_re.search(line_lower):
                 section_relevance += 1
     
     # Add last section
@@ -91,6 +111,16 @@ def find_error_solution(content: str, error_message: str, context: str) -> str:
     return None
 
 
+def match_error_categories(error_lower: str) -> List[str]:
+    """Return the categories whose keywords appear in a lowercased error message"""
+    matched = {
+        category
+        for match in KEYWORD_RE.finditer(error_lower)
+        for category in KEYWORD_CATEGORIES[match[1]]
+    }
+    return [category for category in ERROR_KEYWORDS if category in matched]
+
+
 def analyze_error_fallback(error_message: str, context: str) -> str:
     """Provide basic error analysis when docs aren't available"""
     error_lower = error_message.lower()
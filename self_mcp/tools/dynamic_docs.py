@@ -1,14 +1,16 @@
 """Dynamic documentation fetching from Self protocol GitHub repository"""
 
+from types import MappingProxyType
 from typing import Annotated, Dict, Optional
 
 from pydantic import Field
 
 from ..utils.github_client import get_docs_client
+from ..utils.markdown import lower_text, section_headers, split_lines, split_lower_lines
 
 
 # Topic mapping to file paths in the self-docs repository
-TOPIC_MAP = {
+TOPIC_MAP = MappingProxyType({
     # Getting started
     "quickstart": "use-self/quickstart.md",
     "overview": "README.md",
@@ -28,7 +30,7 @@ TOPIC_MAP = {
     "happy-birthday-example": "contract-integration/happy-birthday-example.md",
     "passport-attributes": "contract-integration/utilize-passport-attributes.md",
     "frontend-configuration": "contract-integration/frontend-configuration.md",
-}
+})
 
 
 async def fetch_self_docs(
@@ -83,37 +85,26 @@ async def fetch_self_docs(
 
 def extract_section(content: str, section: str) -> Optional[str]:
     """Extract a specific section from markdown content"""
-    lines = content.split('\n')
+    lines = split_lines(content)
     section_lower = section.lower()
     
-    # Find section start
-    start_idx = None
-    section_level = None
-    
-    for i, line in enumerate(lines):
-        if line.startswith('#'):
-            # Extract header level and text
-            header = line.lstrip('#').strip()
-            if header.lower() == section_lower or section_lower in header.lower():
-                start_idx = i
-                section_level = len(line) - len(line.lstrip('#'))
-                break
-    
-    if start_idx is None:
+    # Find section start, walking only the document's headers
+    headers = section_headers(content)
+    for position, (title, start_idx, section_level) in enumerate(headers):
+        if section_lower in title:
+            break
+    else:
         return None
     
     # Find section end (next header of same or higher level)
     end_idx = len(lines)
-    for i in range(start_idx + 1, len(lines)):
-        line = lines[i]
-        if line.startswith('#'):
-            current_level = len(line) - len(line.lstrip('#'))
-            if current_level <= section_level:
-                end_idx = i
-                break
+    for _, header_idx, level in headers[position + 1:]:
+        if level <= section_level:
+            end_idx = header_idx
+            break
     
     # Extract section content
-    section_lines = lines[start_idx:end_idx]
+    section_lines = list(lines[start_idx:end_idx])
     
     # Remove trailing empty lines
     while section_lines and not section_lines[-1].strip():
@@ -151,18 +142,21 @@ async def search_docs(
     """
     
     client = get_docs_client()
+    query_lower = query.lower()
     results = []
     
-    # Search through all known documents
+    # Fetch every known document concurrently, then search them in topic order
+    documents = await client.fetch_documents(list(TOPIC_MAP.values()))
     for topic, path in TOPIC_MAP.items():
-        content = await client.fetch_document(path)
-        if content and query.lower() in content.lower():
+        content = documents[path]
+        if content and query_lower in lower_text(content):
             # Find matching lines
-            lines = content.split('\n')
+            lines = split_lines(content)
+            lines_lower = split_lower_lines(content)
             matches = []
             
-            for i, line in enumerate(lines):
-                if query.lower() in line.lower():
+            for i, line_lower in enumerate(lines_lower):
+                if query_lower in line_lower:
                     # Get context (2 lines before and after)
                     start = max(0, i - 2)
                     end = min(len(lines), i + 3)
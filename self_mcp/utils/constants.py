@@ -4,9 +4,11 @@ This module contains all the constant values used across the Self MCP server,
 including country codes, configuration limits, and default values.
 """
 
+from types import MappingProxyType
+
 # Country code mappings (ISO 3166-1 alpha-3)
 # Maps 3-letter country codes to their full names
-COUNTRY_CODES = {
+COUNTRY_CODES = MappingProxyType({
     "USA": "United States",
     "GBR": "United Kingdom", 
     "CAN": "Canada",
@@ -202,7 +204,7 @@ COUNTRY_CODES = {
     "YEM": "Yemen",
     "ZMB": "Zambia",
     "ZWE": "Zimbabwe",
-}
+})
 
 # Configuration constants for Self protocol
 MAX_COUNTRIES_LENGTH = 40  # Maximum number of countries that can be excluded
@@ -1,46 +1,83 @@
 """GitHub API client for fetching Self protocol documentation"""
 
+import asyncio
 import base64
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import httpx
 from pydantic import BaseModel
 
 
+# Shared HTTP client so every docs client reuses one connection pool
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for GitHub requests"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            headers={
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "Self-MCP-Server"
+            },
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client; only the server's shutdown should call this"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class CachedDocument(BaseModel):
     """Cached document with metadata"""
     content: str
     fetched_at: datetime
     path: str
+    etag: Optional[str] = None
 
 
 class GitHubDocsClient:
     """Client for fetching documentation from GitHub with caching"""
     
-    def __init__(self, repo: str = "selfxyz/self-docs", cache_ttl_minutes: int = 60):
+    def __init__(
+        self,
+        repo: str = "selfxyz/self-docs",
+        cache_ttl_minutes: int = 60,
+        missing_ttl_seconds: int = 60
+    ):
         self.repo = repo
         self.base_url = f"https://api.github.com/repos/{repo}/contents"
         self.cache: Dict[str, CachedDocument] = {}
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
-        self._client = None
+        # Paths that returned 404, so repeated probes don't hit GitHub
+        self.missing: Dict[str, datetime] = {}
+        self.missing_ttl = timedelta(seconds=missing_ttl_seconds)
+        # Fetches currently under way, shared by concurrent callers
+        self.in_flight: Dict[str, asyncio.Future] = {}
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                headers={
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "Self-MCP-Server"
-                },
-                timeout=30.0
-            )
-        return self._client
+        """Get the shared HTTP client"""
+        return get_http_client()
     
     def _is_cache_valid(self, cached: CachedDocument) -> bool:
         """Check if cached document is still valid"""
         return datetime.now() - cached.fetched_at < self.cache_ttl
     
+    def get_cached(self, path: str) -> Optional[str]:
+        """Return a cached document if it is still valid, without fetching"""
+        cached = self.cache.get(path)
+        if cached and self._is_cache_valid(cached):
+            return cached.content
+        return None
+    
     async def fetch_document(self, path: str) -> Optional[str]:
         """Fetch a document from GitHub, with caching"""
         # Check cache first
@@ -49,11 +86,34 @@ class GitHubDocsClient:
             if self._is_cache_valid(cached):
                 return cached.content
         
+        # Skip paths recently known to be missing
+        if path in self.missing:
+            if datetime.now() - self.missing[path] < self.missing_ttl:
+                return None
+            del self.missing[path]
+        
+        # Share one request between concurrent callers for the same path
+        task = self.in_flight.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_uncached(path))
+            self.in_flight[path] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(path, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch_uncached(self, path: str) -> Optional[str]:
+        """Fetch a document from GitHub and cache it"""
         try:
             client = await self._get_client()
             url = f"{self.base_url}/{path}"
             
-            response = await client.get(url)
+            # Revalidate an expired copy instead of downloading it again
+            cached = self.cache.get(path)
+            headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+            response = await client.get(url, headers=headers)
+            
+            if response.status_code == 304 and cached:
+                cached.fetched_at = datetime.now()
+                return cached.content
             response.raise_for_status()
             
             data = response.json()
@@ -66,13 +126,15 @@ class GitHubDocsClient:
                 self.cache[path] = CachedDocument(
                     content=content,
                     fetched_at=datetime.now(),
-                    path=path
+                    path=path,
+                    etag=response.headers.get("etag")
                 )
                 
                 return content
             
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
+                self.missing[path] = datetime.now()
                 return None
             # Log the error for debugging
             print(f"HTTP error fetching {path}: {e.response.status_code} - {e.response.text}")
@@ -99,6 +161,24 @@ class GitHubDocsClient:
             
             return None
     
+    async def fetch_documents(self, paths: Sequence[str]) -> Dict[str, Optional[str]]:
+        """Fetch several documents concurrently, keyed by path"""
+        unique_paths = list(dict.fromkeys(paths))
+        results = await asyncio.gather(
+            *(self.fetch_document(path) for path in unique_paths),
+            return_exceptions=True
+        )
+        
+        documents: Dict[str, Optional[str]] = {}
+        for path, result in zip(unique_paths, results):
+            # CancelledError is a BaseException, so check for that rather than Exception
+            if isinstance(result, BaseException):
+                # One failed path shouldn't sink the whole batch
+                print(f"Error fetching {path} in batch: {result}")
+                result = None
+            documents[path] = result
+        return documents
+    
     async def list_directory(self, path: str = "") -> Optional[Dict[str, Any]]:
         """List contents of a directory"""
         try:
@@ -117,6 +197,7 @@ class GitHubDocsClient:
     def clear_cache(self):
         """Clear all cached documents"""
         self.cache.clear()
+        self.missing.clear()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -125,14 +206,9 @@ class GitHubDocsClient:
             "total_cached": len(self.cache),
             "valid_cached": valid_count,
             "expired_cached": len(self.cache) - valid_count,
+            "missing_cached": len(self.missing),
             "cache_ttl_minutes": self.cache_ttl.total_seconds() / 60
         }
-    
-    async def close(self):
-        """Close the HTTP client"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
 
 
 # Global client instance
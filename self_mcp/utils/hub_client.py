@@ -0,0 +1,54 @@
+"""RPC access to the Self Hub contract on Celo"""
+
+import json
+from typing import Any, Dict, Optional
+
+from .constants_abi import HUB_CONTRACT_ABI
+from .networks import CELO_NETWORKS
+
+
+# Hub ABI, parsed once
+HUB_ABI = json.loads(HUB_CONTRACT_ABI)
+
+# One Web3 instance and Hub contract binding per network, reused across calls
+_web3_clients: Dict[str, Any] = {}
+_hub_contracts: Dict[str, Any] = {}
+
+# Shared HTTP session so every RPC endpoint reuses one keep-alive connection pool
+_rpc_session: Optional[Any] = None
+
+
+def get_rpc_session() -> Any:
+    """Get or create the shared requests session for RPC calls"""
+    global _rpc_session
+    if _rpc_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        _rpc_session = requests.Session()
+        _rpc_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return _rpc_session
+
+
+def get_web3(network: str) -> Any:
+    """Get or create the shared Web3 instance for a network"""
+    if network not in _web3_clients:
+        # web3 is heavy to import, so only load it once an RPC call is needed
+        from web3 import Web3
+        
+        _web3_clients[network] = Web3(Web3.HTTPProvider(
+            CELO_NETWORKS[network]["rpc"],
+            request_kwargs={"timeout": 10},
+            session=get_rpc_session()
+        ))
+    return _web3_clients[network]
+
+
+def get_hub_contract(network: str) -> Any:
+    """Get or create the Hub contract binding for a network"""
+    if network not in _hub_contracts:
+        _hub_contracts[network] = get_web3(network).eth.contract(
+            address=CELO_NETWORKS[network]["contracts"]["hub"],
+            abi=HUB_ABI
+        )
+    return _hub_contracts[network]
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Helpers for scanning fetched markdown documents"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+# Tools search the same few cached documents over and over, so derived
+# forms are memoized per document content
+@lru_cache(maxsize=32)
+def lower_text(content: str) -> str:
+    """Lowercased copy of a document, computed once per document"""
+    return content.lower()
+
+
+@lru_cache(maxsize=32)
+def split_lines(content: str) -> Tuple[str, ...]:
+    """Lines of a document, split once and shared as an immutable tuple"""
+    return tuple(content.split('\n'))
+
+
+@lru_cache(maxsize=32)
+def split_lower_lines(content: str) -> Tuple[str, ...]:
+    """Lowercased lines of a document, aligned with split_lines()"""
+    return tuple(lower_text(content).split('\n'))
+
+
+@lru_cache(maxsize=32)
+def section_headers(content: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Headers of a document as (lowercased title, line index, level), in order"""
+    headers = []
+    for i, line in enumerate(split_lines(content)):
+        if line.startswith('#'):
+            title = line.lstrip('#')
+            headers.append((title.strip().lower(), i, len(line) - len(title)))
+    return tuple(headers)
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Network configurations for Celo blockchain"""
 
-CELO_NETWORKS = {
+from types import MappingProxyType
+
+# Source table; only the read-only CELO_NETWORKS view below is public
+_CELO_NETWORKS = {
     "mainnet": {
         "name": "Celo Mainnet",
         "rpc": "https://forno.celo.org",
@@ -29,6 +32,12 @@ CELO_NETWORKS = {
     }
 }
 
+# Expose read-only views; the network table is shared by every tool
+CELO_NETWORKS = MappingProxyType({
+    key: MappingProxyType({**network, "contracts": MappingProxyType(network["contracts"])})
+    for key, network in _CELO_NETWORKS.items()
+})
+
 # Default RPC URLs for quick access
 CELO_MAINNET_RPC = CELO_NETWORKS["mainnet"]["rpc"]
 CELO_TESTNET_RPC = CELO_NETWORKS["testnet"]["rpc"]
\ No newline at end of file
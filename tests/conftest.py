@@ -0,0 +1,25 @@
+"""Shared test fixtures"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Install a FakeClock as time.monotonic in the given module; returns the clock"""
+    def install(module):
+        clock = FakeClock()
+        # Patch the module's view of time only; the event loop keeps the real clock
+        monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=clock))
+        return clock
+
+    return install
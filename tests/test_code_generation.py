@@ -0,0 +1,209 @@
+"""Tests for the generated code cache, with a fake clock and a stubbed docs fetch"""
+
+import asyncio
+
+import pytest
+
+from self_mcp.tools import code_generation
+from self_mcp.tools.code_generation import (
+    CODE_CACHE_STALE_SECONDS,
+    CODE_CACHE_TTL_SECONDS,
+    generate_verification_code,
+    get_code_cache_stats,
+)
+
+KEY = ("frontend-qr", "typescript")
+
+
+def quickstart(version):
+    """A quickstart doc whose frontend code block carries a version marker"""
+    return f"## QRCodeGenerator\n\n```typescript\nconst version = {version};\n```\n"
+
+
+class FakeDocs:
+    """Docs client returning a new doc version per fetch, optionally held at a gate"""
+
+    def __init__(self):
+        self.fetches = 0
+        self.fail = False
+        self.gate = None
+
+    async def fetch_document(self, path):
+        self.fetches += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return None if self.fail else quickstart(self.fetches)
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(code_generation)
+
+
+@pytest.fixture
+def docs(monkeypatch):
+    docs = FakeDocs()
+    monkeypatch.setattr(code_generation, "get_docs_client", lambda: docs)
+    return docs
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(code_generation, "CODE_CACHE", {})
+    monkeypatch.setattr(code_generation, "CODE_REFRESHING", set())
+    monkeypatch.setattr(code_generation, "CODE_CACHE_STATS", {"hits": 0, "misses": 0, "refreshes": 0})
+
+
+async def settle():
+    """Let background refreshes, including their worker-thread extraction, finish"""
+    for _ in range(50):
+        if not code_generation.CODE_REFRESHING:
+            break
+        await asyncio.sleep(0.01)
+
+
+def test_fresh_entry_is_served_without_refetching(clock, docs):
+    async def scenario():
+        first = await generate_verification_code(*KEY)
+        clock.now += CODE_CACHE_TTL_SECONDS - 1
+        second = await generate_verification_code(*KEY)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second == "const version = 1;"
+    assert docs.fetches == 1
+    stats = get_code_cache_stats()
+    assert (stats["misses"], stats["hits"], stats["refreshes"]) == (1, 1, 0)
+
+
+def test_concurrent_cold_callers_share_one_build(clock, docs):
+    async def scenario():
+        docs.gate = asyncio.Event()
+        callers = [asyncio.create_task(generate_verification_code(*KEY)) for _ in range(5)]
+        await asyncio.sleep(0)
+        docs.gate.set()
+        return await asyncio.gather(*callers)
+
+    results = asyncio.run(scenario())
+
+    assert results == ["const version = 1;"] * 5
+    assert docs.fetches == 1
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(clock, docs):
+    async def scenario():
+        await generate_verification_code(*KEY)
+        clock.now += CODE_CACHE_TTL_SECONDS + 1
+
+        # Every stale caller answers from the old entry; only one refresh starts
+        docs.gate = asyncio.Event()
+        stale = await asyncio.gather(*(generate_verification_code(*KEY) for _ in range(5)))
+        assert code_generation.CODE_REFRESHING == {KEY}
+        docs.gate.set()
+        await settle()
+
+        refreshed = await generate_verification_code(*KEY)
+        return stale, refreshed
+
+    stale, refreshed = asyncio.run(scenario())
+
+    assert stale == ["const version = 1;"] * 5
+    assert refreshed == "const version = 2;"
+    assert docs.fetches == 2
+    assert code_generation.CODE_REFRESHING == set()
+    assert get_code_cache_stats()["refreshes"] == 1
+    # The refresh restarts the TTL from the time it finished
+    fresh_until, stale_until, _ = code_generation.CODE_CACHE[KEY]
+    assert fresh_until == clock.now + CODE_CACHE_TTL_SECONDS
+    assert stale_until == fresh_until + CODE_CACHE_STALE_SECONDS
+
+
+def test_expired_entry_is_rebuilt_before_answering(clock, docs):
+    async def scenario():
+        await generate_verification_code(*KEY)
+        clock.now += CODE_CACHE_TTL_SECONDS + CODE_CACHE_STALE_SECONDS
+        return await generate_verification_code(*KEY)
+
+    assert asyncio.run(scenario()) == "const version = 2;"
+    assert docs.fetches == 2
+    assert get_code_cache_stats()["misses"] == 2
+
+
+def test_failed_build_is_not_cached(clock, docs):
+    async def scenario():
+        docs.fail = True
+        failed = await generate_verification_code(*KEY)
+        cached_after_failure = KEY in code_generation.CODE_CACHE
+        docs.fail = False
+        retried = await generate_verification_code(*KEY)
+        return failed, cached_after_failure, retried
+
+    failed, cached_after_failure, retried = asyncio.run(scenario())
+
+    assert failed.startswith("Failed to fetch documentation for frontend-qr")
+    assert not cached_after_failure
+    assert retried == "const version = 2;"
+    assert get_code_cache_stats()["hits"] == 0
+
+
+def test_failed_refresh_keeps_serving_the_stale_entry(clock, docs):
+    async def scenario():
+        await generate_verification_code(*KEY)
+        entry = code_generation.CODE_CACHE[KEY]
+        clock.now += CODE_CACHE_TTL_SECONDS + 1
+
+        docs.fail = True
+        stale = await generate_verification_code(*KEY)
+        await settle()
+        return entry, stale
+
+    entry, stale = asyncio.run(scenario())
+
+    assert stale == "const version = 1;"
+    assert code_generation.CODE_CACHE[KEY] is entry
+    assert code_generation.CODE_REFRESHING == set()
+
+
+SOURCE_WITH_COMMENTS = """// Self verification setup
+import { SelfQRcodeWrapper } from '@selfxyz/qrcode';
+    // indented comment line
+const endpoint = "https://example.com//api"; // trailing note stays
+const pattern = '//not-a-comment';
+//
+export default endpoint;"""
+
+
+def test_strip_comments_drops_only_comment_lines():
+    assert code_generation.strip_comments(SOURCE_WITH_COMMENTS) == (
+        "import { SelfQRcodeWrapper } from '@selfxyz/qrcode';\n"
+        'const endpoint = "https://example.com//api"; // trailing note stays\n'
+        "const pattern = '//not-a-comment';\n"
+        "export default endpoint;"
+    )
+
+
+def test_strip_comments_keeps_spdx_license_line():
+    source = "// SPDX-License-Identifier: MIT\n// helper\npragma solidity ^0.8.28;"
+    assert code_generation.strip_comments(source) == (
+        "// SPDX-License-Identifier: MIT\npragma solidity ^0.8.28;"
+    )
+
+
+def test_concise_option_strips_comments_from_generated_code(clock, docs, monkeypatch):
+    async def fetch_document(path):
+        return f"## QRCodeGenerator\n\n```typescript\n{SOURCE_WITH_COMMENTS}\n```\n"
+
+    monkeypatch.setattr(docs, "fetch_document", fetch_document)
+
+    async def scenario():
+        full = await generate_verification_code(*KEY)
+        concise = await generate_verification_code(*KEY, concise=True)
+        return full, concise
+
+    full, concise = asyncio.run(scenario())
+
+    assert full == SOURCE_WITH_COMMENTS
+    assert concise == code_generation.strip_comments(SOURCE_WITH_COMMENTS)
+    assert "https://example.com//api" in concise
+    assert "// Self verification setup" not in concise
@@ -0,0 +1,43 @@
+"""Tests for the rendered verification configuration"""
+
+import asyncio
+
+from self_mcp.tools.config_generation import generate_verification_config, to_js_object
+
+
+def test_to_js_object_quotes_values_and_keeps_arrays_on_one_line():
+    rendered = to_js_object({
+        "minimumAge": 18,
+        "nationality": True,
+        "excludedCountries": ["IRN", "PRK"],
+        "ofac": True,
+    })
+
+    assert rendered == (
+        "{\n"
+        "  minimumAge: 18,\n"
+        "  nationality: true,\n"
+        '  excludedCountries: ["IRN", "PRK"],\n'
+        "  ofac: true\n"
+        "}"
+    )
+
+
+def test_to_js_object_renders_no_disclosures_as_empty_object():
+    assert to_js_object({}) == "{}"
+
+
+def test_generated_config_uses_quoted_country_codes():
+    output = asyncio.run(generate_verification_config({
+        "app_name": "My App",
+        "minimum_age": 21,
+        "exclude_countries": ["IRN", "PRK"],
+    }))
+
+    assert (
+        "  disclosures: {\n"
+        "  minimumAge: 21,\n"
+        '  excludedCountries: ["IRN", "PRK"]\n'
+        "}\n"
+    ) in output
+    assert 'verifier.excludeCountries("IRN", "PRK")' in output
@@ -0,0 +1,240 @@
+"""Tests for the Hub contract tools, with the RPC layer stubbed out"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from self_mcp.tools import contract_interaction
+from self_mcp.tools.contract_interaction import (
+    HUB_CONFIG_CACHE_MAX_ENTRIES,
+    HUB_CONFIG_CACHE_TTL_SECONDS,
+    batch_check_configs,
+    compute_config_id,
+    read_hub_config,
+)
+
+
+class FakeCall:
+    """A prepared contract call, remembering the config ID it was made with"""
+
+    def __init__(self, name, config_id):
+        self.name = name
+        self.config_id = config_id
+
+
+class FakeFunctions:
+    def verificationConfigV2Exists(self, config_id):
+        return FakeCall("verificationConfigV2Exists", config_id)
+
+
+class FakeHubContract:
+    functions = FakeFunctions()
+
+
+class FakeBatch:
+    """Stand-in for web3's batch_requests() context manager"""
+
+    def __init__(self, deployed, error=None):
+        self.deployed = deployed
+        self.error = error
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add(self, call):
+        self.calls.append(call)
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return [call.config_id in self.deployed for call in self.calls]
+
+
+class FakeWeb3:
+    def __init__(self, batch):
+        self.batch = batch
+        self.batches = 0
+
+    def batch_requests(self):
+        self.batches += 1
+        return self.batch
+
+
+@pytest.fixture
+def deployed_id():
+    return compute_config_id(18, ("IRN", "PRK"), (True, False, False))
+
+
+@pytest.fixture
+def missing_id():
+    return compute_config_id(21, (), (False, False, False))
+
+
+def stub_rpc(monkeypatch, batch):
+    w3 = FakeWeb3(batch)
+    monkeypatch.setattr(contract_interaction, "get_web3", lambda network: w3)
+    monkeypatch.setattr(contract_interaction, "get_hub_contract", lambda network: FakeHubContract())
+    return w3
+
+
+def test_batch_reports_each_config_in_one_round_trip(monkeypatch, deployed_id, missing_id):
+    batch = FakeBatch(deployed={bytes.fromhex(deployed_id[2:])})
+    w3 = stub_rpc(monkeypatch, batch)
+
+    result = asyncio.run(batch_check_configs([deployed_id, missing_id, deployed_id], "testnet"))
+
+    assert result == {
+        "network": "testnet",
+        "results": {deployed_id: True, missing_id: False},
+        "existing_count": 1,
+    }
+    # Duplicates are checked once, with the decoded bytes32 ID, in a single batch
+    assert w3.batches == 1
+    assert [call.config_id for call in batch.calls] == [
+        bytes.fromhex(deployed_id[2:]),
+        bytes.fromhex(missing_id[2:]),
+    ]
+
+
+def test_batch_names_every_invalid_config_id(monkeypatch, deployed_id):
+    w3 = stub_rpc(monkeypatch, FakeBatch(deployed=set()))
+    invalid = ["0x1234", deployed_id[2:], "0x" + "zz" * 32, "0x" + "ab " * 21 + "a"]
+
+    result = asyncio.run(batch_check_configs([deployed_id, *invalid], "mainnet"))
+
+    assert result["invalid_config_ids"] == invalid
+    assert "64 hex characters" in result["error"]
+    # Nothing is sent when any entry is malformed
+    assert w3.batches == 0
+
+
+def test_batch_with_no_config_ids_skips_rpc(monkeypatch):
+    w3 = stub_rpc(monkeypatch, FakeBatch(deployed=set()))
+
+    result = asyncio.run(batch_check_configs([], "mainnet"))
+
+    assert result == {"network": "mainnet", "results": {}, "existing_count": 0}
+    assert w3.batches == 0
+
+
+def test_failed_batch_returns_structured_error(monkeypatch, deployed_id, missing_id):
+    stub_rpc(monkeypatch, FakeBatch(deployed=set(), error=ConnectionError("forno unreachable")))
+
+    result = asyncio.run(batch_check_configs([deployed_id, missing_id], "mainnet"))
+
+    assert result == {
+        "error": "Unexpected error checking configs: forno unreachable",
+        "network": "mainnet",
+    }
+
+
+class FakeReadCall:
+    def __init__(self, hub, name, config_id):
+        self.hub = hub
+        self.name = name
+        self.config_id = config_id
+
+    def call(self):
+        self.hub.calls.append(self.name)
+        if self.hub.error:
+            raise self.hub.error
+        if self.name == "verificationConfigV2Exists":
+            return self.config_id in self.hub.deployed
+        # 18+, IRN and PRK excluded, basic OFAC check
+        countries = int.from_bytes(b"IRNPRK".ljust(30, b"\0"), "little")
+        return (True, 18, True, [countries, 0, 0, 0], [True, False, False])
+
+
+class FakeReadHub:
+    """Hub contract answering reads for a set of deployed config IDs"""
+
+    def __init__(self, deployed=()):
+        self.deployed = set(deployed)
+        self.error = None
+        self.calls = []
+        hub = self
+        self.functions = SimpleNamespace(
+            verificationConfigV2Exists=lambda cid: FakeReadCall(hub, "verificationConfigV2Exists", cid),
+            getVerificationConfigV2=lambda cid: FakeReadCall(hub, "getVerificationConfigV2", cid),
+        )
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(contract_interaction)
+
+
+@pytest.fixture
+def hub(monkeypatch, deployed_id):
+    hub = FakeReadHub(deployed={bytes.fromhex(deployed_id[2:])})
+    monkeypatch.setattr(contract_interaction, "get_hub_contract", lambda network: hub)
+    monkeypatch.setattr(contract_interaction, "HUB_CONFIG_CACHE", {})
+    return hub
+
+
+def test_cached_config_is_served_without_rpc(clock, hub, deployed_id):
+    first = asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    # Mutating a returned result must not leak into the cache
+    first["configuration"]["excluded_countries"]["codes"].append("USA")
+    second = asyncio.run(read_hub_config(deployed_id.upper().replace("0X", "0x"), "mainnet"))
+
+    assert hub.calls == ["verificationConfigV2Exists", "getVerificationConfigV2"]
+    assert second["configuration"]["excluded_countries"]["codes"] == ["IRN", "PRK"]
+    assert second["configuration"]["minimum_age"]["value"] == 18
+    # Results echo the caller's spelling of the ID
+    assert second["config_id"] == deployed_id.upper().replace("0X", "0x")
+
+
+def test_cached_config_expires_after_ttl(clock, hub, deployed_id):
+    asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    clock.now += HUB_CONFIG_CACHE_TTL_SECONDS - 1
+    asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    assert len(hub.calls) == 2
+
+    clock.now += 1
+    asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    assert len(hub.calls) == 4
+
+
+def test_cache_is_per_network(clock, hub, deployed_id):
+    asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    asyncio.run(read_hub_config(deployed_id, "testnet"))
+    assert len(hub.calls) == 4
+
+
+def test_cache_evicts_oldest_entry_when_full(clock, hub):
+    config_ids = ["0x" + f"{i:064x}" for i in range(HUB_CONFIG_CACHE_MAX_ENTRIES + 1)]
+    hub.deployed = {bytes.fromhex(cid[2:]) for cid in config_ids}
+
+    async def scenario():
+        for config_id in config_ids:
+            await read_hub_config(config_id, "mainnet")
+
+    asyncio.run(scenario())
+
+    cache = contract_interaction.HUB_CONFIG_CACHE
+    assert len(cache) == HUB_CONFIG_CACHE_MAX_ENTRIES
+    assert (config_ids[0], "mainnet") not in cache
+    assert (config_ids[1], "mainnet") in cache
+    assert (config_ids[-1], "mainnet") in cache
+
+
+def test_errors_and_missing_configs_are_not_cached(clock, hub, deployed_id, missing_id):
+    hub.error = ConnectionError("forno unreachable")
+    failed = asyncio.run(read_hub_config(deployed_id, "mainnet"))
+    assert failed["error"] == "Network connection error: forno unreachable"
+
+    hub.error = None
+    missing = asyncio.run(read_hub_config(missing_id, "mainnet"))
+    assert missing["exists"] is False
+    assert contract_interaction.HUB_CONFIG_CACHE == {}
+
+    # Both are looked up again on the next call
+    assert asyncio.run(read_hub_config(deployed_id, "mainnet"))["exists"] is True
+    asyncio.run(read_hub_config(missing_id, "mainnet"))
+    assert hub.calls.count("verificationConfigV2Exists") == 4
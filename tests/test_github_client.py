@@ -0,0 +1,113 @@
+"""Tests for GitHubDocsClient caching, against an httpx.MockTransport"""
+
+import asyncio
+import base64
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from self_mcp.utils import github_client
+from self_mcp.utils.github_client import GitHubDocsClient
+
+PATH = "use-self/quickstart.md"
+
+
+def content_response(body, etag=None):
+    """A GitHub contents API response for a markdown body"""
+    headers = {"etag": etag} if etag else {}
+    return httpx.Response(200, headers=headers, json={
+        "encoding": "base64",
+        "content": base64.b64encode(body.encode("utf-8")).decode("ascii"),
+    })
+
+
+@pytest.fixture
+def github(monkeypatch):
+    """Route the shared HTTP client through a handler; returns the recorded requests"""
+    def install(handler):
+        requests = []
+
+        async def record(request):
+            requests.append(request)
+            return await handler(request)
+
+        monkeypatch.setattr(
+            github_client, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(record))
+        )
+        return requests
+
+    return install
+
+
+def test_304_reuses_the_cached_body(github):
+    async def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return content_response("# Quickstart", etag='"v1"')
+
+    requests = github(handler)
+    client = GitHubDocsClient()
+
+    async def scenario():
+        first = await client.fetch_document(PATH)
+        # Expire the entry so the next fetch has to revalidate
+        client.cache[PATH].fetched_at -= client.cache_ttl
+        expired_at = client.cache[PATH].fetched_at
+        second = await client.fetch_document(PATH)
+        return first, second, expired_at
+
+    first, second, expired_at = asyncio.run(scenario())
+
+    assert first == second == "# Quickstart"
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"']
+    # The 304 renews the cached copy, so it is valid again without a download
+    assert client.cache[PATH].fetched_at > expired_at
+    assert client.get_cached(PATH) == "# Quickstart"
+
+
+def test_404_is_not_refetched_within_the_missing_window(github):
+    async def handler(request):
+        return httpx.Response(404, text="Not Found")
+
+    requests = github(handler)
+    client = GitHubDocsClient(missing_ttl_seconds=60)
+
+    async def scenario():
+        first = await client.fetch_document(PATH)
+        second = await client.fetch_document(PATH)
+        within_window = len(requests)
+
+        # Once the window has passed, the path is probed again
+        client.missing[PATH] -= timedelta(seconds=61)
+        third = await client.fetch_document(PATH)
+        return first, second, third, within_window
+
+    first, second, third, within_window = asyncio.run(scenario())
+
+    assert first is second is third is None
+    assert within_window == 1
+    assert len(requests) == 2
+
+
+def test_concurrent_fetches_of_one_path_share_a_request(github):
+    async def handler(request):
+        # Hold the response so every caller arrives while the fetch is in flight
+        await asyncio.sleep(0.05)
+        return content_response("# Quickstart")
+
+    requests = github(handler)
+    client = GitHubDocsClient()
+
+    async def scenario():
+        before = client.get_cached(PATH)
+        results = await asyncio.gather(*(client.fetch_document(PATH) for _ in range(10)))
+        return before, results
+
+    before, results = asyncio.run(scenario())
+
+    assert before is None
+    assert results == ["# Quickstart"] * 10
+    assert len(requests) == 1
+    assert client.in_flight == {}
+    assert client.get_cached(PATH) == "# Quickstart"
@@ -0,0 +1,28 @@
+"""Tests for the server lifespan and the shared HTTP pool"""
+
+import asyncio
+
+import httpx
+
+from self_mcp import server
+from self_mcp.utils import github_client
+
+
+def test_pool_stays_open_until_the_last_session_ends(monkeypatch):
+    pool = httpx.AsyncClient()
+    monkeypatch.setattr(github_client, "_http_client", pool)
+
+    async def scenario():
+        async with server.lifespan(server.mcp):
+            async with server.lifespan(server.mcp):
+                pass
+            # Another session is still connected, so the pool must survive
+            after_first = pool.is_closed
+        return after_first
+
+    after_first = asyncio.run(scenario())
+
+    assert after_first is False
+    assert pool.is_closed
+    assert github_client._http_client is None
+    assert server._active_sessions == 0
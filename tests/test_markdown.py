@@ -0,0 +1,69 @@
+"""Tests for the memoized markdown helpers and the section lookup built on them"""
+
+from self_mcp.tools.dynamic_docs import extract_section
+from self_mcp.utils.markdown import lower_text, section_headers, split_lines, split_lower_lines
+
+DOC = """# Quickstart
+Intro text.
+
+## Install
+Run `npm i @selfxyz/core`.
+
+### Install on Windows
+Use PowerShell.
+
+## Configure
+Set the Scope.
+"""
+
+
+def test_section_headers_record_title_line_and_level():
+    assert section_headers(DOC) == (
+        ("quickstart", 0, 1),
+        ("install", 3, 2),
+        ("install on windows", 6, 3),
+        ("configure", 9, 2),
+    )
+
+
+def test_section_headers_strip_padding_and_skip_body_lines():
+    doc = "intro\n##   Spaced Title  \ntext with # inside\n#"
+    assert section_headers(doc) == (("spaced title", 1, 2), ("", 3, 1))
+
+
+def test_split_lines_with_and_without_trailing_newline():
+    assert split_lines("a\nb\n") == ("a", "b", "")
+    assert split_lines("a\nb") == ("a", "b")
+    assert split_lines("") == ("",)
+
+
+def test_lowered_lines_stay_aligned_with_lines():
+    doc = "# Title\nMIXED Case\nΣΑΣ\n"
+    assert lower_text(doc) == doc.lower()
+    assert split_lower_lines(doc) == tuple(line.lower() for line in split_lines(doc))
+    assert len(split_lower_lines(DOC)) == len(split_lines(DOC))
+
+
+def test_helpers_return_shared_immutable_results():
+    assert split_lines(DOC) is split_lines(DOC)
+    assert isinstance(split_lines(DOC), tuple)
+    assert isinstance(section_headers(DOC), tuple)
+
+
+def test_section_runs_to_next_header_of_same_or_higher_level():
+    assert extract_section(DOC, "install") == (
+        "## Install\n"
+        "Run `npm i @selfxyz/core`.\n"
+        "\n"
+        "### Install on Windows\n"
+        "Use PowerShell."
+    )
+
+
+def test_last_section_runs_to_end_of_document():
+    assert extract_section(DOC, "CONFIGURE") == "## Configure\nSet the Scope."
+    assert extract_section(DOC.rstrip("\n"), "configure") == "## Configure\nSet the Scope."
+
+
+def test_missing_section_returns_none():
+    assert extract_section(DOC, "deploy") is None